@@ -1,4 +1,4 @@
-from helpers.common import JsonFile, dict_keys
+from helpers.common import JsonFile
 from logger import info, debug
 
 __name__ = "ConfigModule"
@@ -64,7 +64,7 @@ class ConfigReader:
             self.json.file = {}
 
         # Check if the key is present. If not, set it.
-        if key not in dict_keys(self.json.file):
+        if key not in self.json.file:
             # Set it so we can check if the key was modified.
             self.updated = True
             self.updated_keys.append(key)
@@ -72,7 +72,8 @@ class ConfigReader:
             self.json.file[key] = default
 
             # Write it to the file.
-            self.json.write_file(self.json.file)
+            # Pretty as people are meant to edit the config.
+            self.json.write_file(self.json.file, pretty= True)
 
             # Return default
             return default
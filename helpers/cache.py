@@ -1,5 +1,5 @@
 from .time import get_timestamp
-from .common import dict_keys
+from collections import OrderedDict
 
 class Cache:
     """Cache of objects with IDs."""
@@ -13,7 +13,8 @@ class Cache:
             cache_limit (int): A limit to how many objects can be max cached
                 before other objects start being removed.
         """
-        self._cache = {} # The main cache object.
+        # The main cache object. Ordered from least to most recently used.
+        self._cache = OrderedDict()
         self.length = cache_length * 60 # Multipled by 60 to get the length in seconds rather than minutes.
         self._cache_limit = cache_limit
     
@@ -23,7 +24,7 @@ class Cache:
 
         return len(self._cache)
     
-    def __len__(self): return self.cached_items()
+    def __len__(self): return self.cached_items
     
     def cache(self, cache_id : int, cache_obj : object) -> None:
         """Adds an object to the cache."""
@@ -32,6 +33,7 @@ class Cache:
             "expire" : get_timestamp() + self.length,
             "object" : cache_obj
         }
+        self._cache.move_to_end(cache_id)
         self.run_checks()
     
     def remove_cache(self, cache_id : int) -> None:
@@ -49,49 +51,34 @@ class Cache:
         curr_obj = self._cache.get(cache_id)
         if curr_obj is None:
             return None
+        
+        # Expired objects are removed as we come across them.
+        if curr_obj["expire"] < get_timestamp():
+            self.remove_cache(cache_id)
+            return None
+        
+        # Mark it as recently used.
+        self._cache.move_to_end(cache_id)
         return curr_obj["object"]
     
-    def _get_cached_ids(self) -> list:
-        """Returns a list of all cache IDs currently cached."""
-        return dict_keys(self._cache)
-
     def _get_object(self, cache_id : int) -> list:
         """Gets object using set function."""
         raise NotImplementedError("The GDPyS Cache system cannot yet create objects by itself.")
         # return cache_id, object
     
-    def _get_expired_cache(self) -> list:
-        """Returns a list of expired cache IDs."""
-        current_timestamp = get_timestamp()
-        expired = []
-        for cache_id in self._get_cached_ids():
-            # We dont want to use get as that  will soon have the ability to make its own objects, slowing this down.
-            if self._cache[cache_id]["expire"] < current_timestamp:
-                # This cache is expired.
-                expired.append(cache_id)
-        return expired
-    
-    def _remove_expired_cache(self) -> None:
-        """Removes all of the expired cache."""
-        for cache_id in self._get_expired_cache():
-            self.remove_cache(cache_id)
-    
     def _remove_limit_cache(self) -> None:
         """Removes all objects past limit if cache reached its limit."""
         
-        # Calculate how much objects we have to throw away.
-        throw_away_count = len(self._get_cached_ids()) - self._cache_limit
-
-        if throw_away_count < 1:
-            # No levels to throw away
-            return
-        
-        # Get x oldest ids to remove.
-        throw_away_ids = self._get_cached_ids()[:throw_away_count]
-        for cache_id in throw_away_ids:
-            self.remove_cache(cache_id)
+        # The least recently used objects are at the start.
+        while len(self._cache) > self._cache_limit:
+            self._cache.popitem(last=False)
     
     def run_checks(self) -> None:
-        """Runs checks on the cache."""
-        self._remove_expired_cache()
+        """Runs checks on the cache.
+        
+        Note:
+            Expired objects are not searched for here as that requires going
+                through the whole cache. They are removed by `get` or once
+                they become the least recently used instead.
+        """
         self._remove_limit_cache()
@@ -1,13 +1,15 @@
 # Common functions related to simple python-related things.
 from typing import Union
 import os
-from json import dump as json_dump
 try:
+    import orjson
     from orjson import loads as json_load
 except ImportError:
     # there is always one person in milion peoples that
     # orjson wont work for them so thats a backup
+    orjson = None
     from json import loads as json_load
+    from json import dumps as json_dumps
 
 class JsonFile:
     """Assists within working with simple JSON files."""
@@ -23,7 +25,8 @@ class JsonFile:
         self.file = None
         self.file_name = file_name
         if os.path.exists(file_name):
-            with open(file_name) as f:
+            # Both orjson and json can parse bytes directly.
+            with open(file_name, "rb") as f:
                 self.file = json_load(f.read())
 
     def get_file(self) -> dict:
@@ -34,27 +37,37 @@ class JsonFile:
         """
         return self.file
 
-    def write_file(self, new_content: Union[dict, list]) -> None:
+    def write_file(
+        self,
+        new_content: Union[dict, list],
+        pretty: bool = False
+    ) -> None:
         """Writes `new_content` to the target file.
         
         Args:
             new_content (dict, list): The new content that should be placed
                 within the file.
+            pretty (bool): Whether the JSON should be indented. Use this for
+                files that are meant to be edited by people.
         """
 
-        with open(self.file_name, "w") as f:
-            json_dump(new_content, f, indent=4)
-        self.file = new_content
-
-def dict_keys(d: dict) -> tuple:
-    """Returns a `tuple` of all the keys present within the dictionary `d`.
-    
-    Args:
-        d (dict): A dictionary to fetch all the keys of.
-    """
+        # orjson only supports an indent of 2 but is way faster.
+        if orjson is not None:
+            dumped = orjson.dumps(
+                new_content,
+                option= orjson.OPT_INDENT_2 if pretty else None
+            )
+        else:
+            # The stdlib adds spaces after separators unless told not to.
+            dumped = json_dumps(
+                new_content,
+                indent= 4 if pretty else None,
+                separators= None if pretty else (",", ":")
+            ).encode()
 
-    # I decided to use tuple as its immutable.
-    return tuple(d)
+        with open(self.file_name, "wb") as f:
+            f.write(dumped)
+        self.file = new_content
 
 def safe_username(uname: str) -> str:
     """Generates a "safe username" from a regular username.
@@ -1,21 +1,101 @@
 from .glob import glob
-from .user import User
-from .song import Song
+from .user import User, USER_ROW_COLUMNS
+from .song import Song, SONG_ROW_COLUMNS, _EMPTY_SONG
 from config import conf
 from const import Difficulty, LevelLengths, LevelStatus
 from helpers.time import get_timestamp
+from typing import List
 import aiofiles
+import asyncio
 import os
 import sys
 
 # Local Consts.
 MAX_CACHE_SIZE = 5000
+# The extra string of a level without any batch nodes. It is shared by all
+# levels that don't set their own.
+DEFAULT_EXTRA_STR = sys.intern(
+    "0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0"
+)
+# Files smaller than this are read/written synchronously as that is faster
+# than going through the aiofiles threadpool and barely blocks the loop.
+MAX_SYNC_IO_SIZE = 65536
+
+# The `levels` table columns paired with the `Level` attribute they are set
+# to, in the order they are selected. `None` means the column is not stored
+# directly on the object.
+LEVEL_ROW_FIELDS = (
+    ("id", "id"),
+    ("name", "name"),
+    ("user_id", None),
+    ("description", "description"),
+    ("song_id", None),
+    ("extra_str", "extra_str"),
+    ("replay", "replay"),
+    ("game_version", "game_version"),
+    ("binary_version", "binary_version"),
+    ("timestamp", "timestamp"),
+    ("downloads", "downloads"),
+    ("likes", "likes"),
+    ("stars", "stars"),
+    ("difficulty", "difficulty"),
+    ("demon_diff", "demon_diff"),
+    ("coins", "coins"),
+    ("coins_verified", "coins_verified"),
+    ("requested_stars", "requested_stars"),
+    ("featured_id", "feature_id"),
+    ("rate_status", "rate_status"),
+    ("ldm", "ldm"),
+    ("objects", "objects"),
+    ("password", "password"),
+    ("working_time", "working_time"),
+    ("level_ver", "level_version"),
+    ("track_id", "track_id"),
+    ("length", "length"),
+    ("duals", "dual"),
+    ("unlisted", "unlisted")
+)
+LEVEL_ROW_COLUMNS = tuple(col for col, _ in LEVEL_ROW_FIELDS)
+USER_ID_INDEX = LEVEL_ROW_COLUMNS.index("user_id")
+SONG_ID_INDEX = LEVEL_ROW_COLUMNS.index("song_id")
+
+# Where the JOINed user and song data is located within the level row.
+USER_ROW_SLICE = slice(
+    len(LEVEL_ROW_COLUMNS),
+    len(LEVEL_ROW_COLUMNS) + len(USER_ROW_COLUMNS)
+)
+SONG_ROW_SLICE = slice(USER_ROW_SLICE.stop, None)
+
+# Fetches the level along with its creator and song in a single query.
+# LEFT JOINs are used as the creator or song may not be in the db.
+LEVEL_SELECT = (
+    "SELECT " + ", ".join(
+        [f"levels.{c}" for c in LEVEL_ROW_COLUMNS]
+        + [f"users.{c}" for c in USER_ROW_COLUMNS]
+        + [f"songs.{c}" for c in SONG_ROW_COLUMNS]
+    ) + " FROM levels "
+    "LEFT JOIN users ON users.id = levels.user_id "
+    "LEFT JOIN songs ON songs.id = levels.song_id "
+)
+LEVEL_BY_ID_QUERY = LEVEL_SELECT + "WHERE levels.id = %s LIMIT 1"
 
 class Level:
     """An object representing the values and qualities of a Geometry Dash
     level in code. It contains all of the functions and properties to work
     with levels."""
 
+    # Levels are kept around in large quantities within the level cache so
+    # we want them to be as lightweight as possible.
+    __slots__ = (
+        "id", "name", "creator", "comments", "description", "song",
+        "track_id", "level_version", "length", "dual", "unlisted",
+        "extra_str", "replay", "game_version", "binary_version", "timestamp",
+        "likes", "downloads", "stars", "difficulty", "demon_diff", "coins",
+        "coins_verified", "requested_stars", "feature_id", "rate_status",
+        "ldm", "objects", "password", "working_time", "_cache",
+        "_path_cached"
+    )
+
     def __init__(self) -> None:
         """Sets all the placeholder attributes. Use classmethods instead
         please."""
@@ -25,14 +105,14 @@ class Level:
         self.creator: User = User()
         self.comments: list = [] # TODO: Correct type hints when comment object is done.
         self.description: str = ""
-        self.song: Song = Song()
+        self.song: Song = _EMPTY_SONG
         self.track_id: int = 0 # The in-game song IDs. Don't like how its done.
         self.level_version: int = 0
         self.length: LevelLengths = 0
         self.dual: bool = False
         self.unlisted: bool = False
         # Contains batch nodes to help with rendering
-        self.extra_str: str = "0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0_0"
+        self.extra_str: str = DEFAULT_EXTRA_STR
         self.replay: str = ""
         self.game_version: int = 22
         self.binary_version: int = 35
@@ -55,19 +135,32 @@ class Level:
         self.working_time: int = 0 # Time spent building the level.
 
         # Special cache for small levels.
-        self._cache: str = ""
+        self._cache: bytes = b""
+
+        # The path of the level once we know it exists in storage.
+        self._path_cached: str = None
     
     @property
     def path(self) -> str:
         """Returns the path to the level's local location in storage."""
 
+        # We already know it exists, save ourselves the stat.
+        if self._path_cached: return self._path_cached
+
         path = f"{conf.dir_levels}/{self.id}"
 
         # Check if the level exists locally.
         if not os.path.exists(path): return
 
+        self._path_cached = path
         return path
     
+    def invalidate_path(self) -> None:
+        """Clears the cached level path. Call this if the level is removed
+        from storage."""
+
+        self._path_cached = None
+    
     @property
     def demon(self) -> bool:
         """Returns a bool of whether the level has a demon rating."""
@@ -97,11 +190,13 @@ class Level:
 
         return self.has_status(LevelStatus.EPIC)
 
-    async def load(self) -> str:
+    async def load(self) -> bytes:
         """Loads the level data directly from storage and returns it.
         
         Note:
             If the level is really small, it can be cached for s p e e d.
+                The data is returned as `bytes`, so decode it if a `str` is
+                required.
         """
 
         # Check cache first in case its a really small level.
@@ -113,13 +208,26 @@ class Level:
         # Check if it even is locally available
         if not p: return
 
-        # Loading directly from storage.
-        async with aiofiles.open(p, "r") as f:
-            contents = await f.read()
+        # Loading directly from storage. We size the already open file so no
+        # extra stat is needed.
+        try:
+            with open(p, "rb") as f:
+                small = os.fstat(f.fileno()).st_size < MAX_SYNC_IO_SIZE
+                if small:
+                    contents = f.read()
+            
+            # Large levels go through aiofiles so we don't block the loop.
+            if not small:
+                async with aiofiles.open(p, "rb") as f:
+                    contents = await f.read()
+        except FileNotFoundError:
+            # It has been removed since we cached the path.
+            self.invalidate_path()
+            return
         
         # Check if the contents are below 5kb to see
         # if we can cache.
-        if sys.getsizeof(contents) <= MAX_CACHE_SIZE:
+        if len(contents) <= MAX_CACHE_SIZE:
             self._cache = contents
         
         # Return it
@@ -132,14 +240,23 @@ class Level:
             contents (str): The level string to be saved.
         """
 
+        # Encode it once, the same bytes are both cached and stored.
+        contents_b = contents.encode()
+
         # If the level is small enough, cache it for
         # faster access later.
-        if sys.getsizeof(contents) <= MAX_CACHE_SIZE:
-            self._cache = contents
+        if len(contents_b) <= MAX_CACHE_SIZE:
+            self._cache = contents_b
         
         # Write the level to storage.
-        async with aiofiles.open(f"{conf.dir_levels}/{self.id}", "w+") as f:
-            await f.write(contents)
+        p = f"{conf.dir_levels}/{self.id}"
+        if len(contents_b) < MAX_SYNC_IO_SIZE:
+            with open(p, "wb") as f:
+                f.write(contents_b)
+        else:
+            async with aiofiles.open(p, "wb") as f:
+                await f.write(contents_b)
+        self._path_cached = p
     
     def cache(self) -> None:
         """Adds the current level into the global level cache."""
@@ -155,66 +272,73 @@ class Level:
             level_id (int): The ID of the level in the database.
             full (bool): Whether non-crucial data will be also fetched (such
                 as comments).
+        
+        Returns:
+            `None` if not found, else instance of `Level`.
         """
 
         # Create the instance of Level.
         self = cls()
 
-        # Fetch data from MySQL
-        level_db = await glob.sql.fetchone(
-            "SELECT id, name, user_id, description,"
-            "song_id, extra_str, replay, game_version,"
-            "binary_version, timestamp, downloads, likes,"
-            "stars, difficulty, demon_diff, coins, coins_verified,"
-            "requested_stars, featured_id, rate_status, ldm,"
-            "objects, password FROM levels, working_time, level_ver, "
-            "track_id, length, duals, unlisted WHERE id = %s LIMIT 1",
-            (level_id,)
-        )
+        # Fetch the level, creator and song all at once from MySQL.
+        level_db = await glob.sql.fetchone(LEVEL_BY_ID_QUERY, (level_id,))
 
         # Stop an exception if level is not found.
         if level_db is None: return
 
-        # Set simple data and store.
-        (
-            self.id,
-            self.name,
-            user_id,
-            self.description,
-            song_id,
-            self.extra_str,
-            self.replay,
-            self.game_version,
-            self.binary_version,
-            self.timestamp,
-            self.downloads,
-            self.likes,
-            self.stars,
-            self.difficulty,
-            self.demon_diff,
-            self.coins,
-            self.coins_verified,
-            self.requested_stars,
-            self.feature_id,
-            self.rate_status,
-            self.ldm,
-            self.objects,
-            self.password,
-            self.working_time,
-            self.level_version,
-            self.track_id,
-            self.length,
-            self.dual,
-            self.unlisted
-        ) = level_db
-
-        # GDPyS custom objects.
-        self.creator = await User.from_id(user_id)
-        self.song = await Song.from_id(song_id)
+        await self._set_row(level_db)
 
         if full:
             await self._fetch_comments()
+        
+        return self
     
+    async def _set_row(self, level_row: tuple, songs: dict = None) -> None:
+        """Sets the level data from a row fetched using `LEVEL_SELECT`.
+        
+        Args:
+            level_row (tuple): The row containing the level data followed by
+                the JOINed creator and song data.
+            songs (dict): Already resolved songs (song id: `Song` or `None`)
+                for songs that are not in the db. Songs found here are not
+                fetched again.
+        """
+
+        # Set simple data and store.
+        self._apply_row(level_row)
+        user_id = level_row[USER_ID_INDEX]
+        song_id = level_row[SONG_ID_INDEX]
+
+        # GDPyS custom objects. We still prefer the cached ones. The ones
+        # that may need IO are stored as attr name: coro to be ran together.
+        fetches = {}
+        if not (creator := glob.user_cache.get(user_id)):
+            fetches["creator"] = User._from_row(level_row[USER_ROW_SLICE])
+        self.creator = creator
+
+        if not song_id:
+            self.song = _EMPTY_SONG
+        elif song := glob.song_cache.get(song_id):
+            self.song = song
+        elif song := Song._from_row(level_row[SONG_ROW_SLICE]):
+            glob.song_cache.cache(song.id, song)
+            self.song = song
+        elif songs is not None and song_id in songs:
+            self.song = songs[song_id]
+        else:
+            # Not in the db, let `from_id` try the other sources.
+            fetches["song"] = Song.from_id(song_id)
+
+        if fetches:
+            results = await asyncio.gather(*fetches.values())
+            for attr, obj in zip(fetches, results):
+                setattr(self, attr, obj)
+
+        # The creator may be missing from the db. Use a placeholder so the
+        # level is still usable.
+        if self.creator is None:
+            self.creator = User()
+
     @classmethod
     async def from_id(cls, level_id: int):
         """Creates an instance of `Level` from data in MySQL database.
@@ -230,7 +354,72 @@ class Level:
         if cache_l := glob.level_cache.get(level_id): return cache_l
 
         # We are required to utilise the sql (slow).
-        return Level.from_sql(level_id, True)
+        if level := await cls.from_sql(level_id, True):
+            # Cache it so we don't have to do this again.
+            level.cache()
+        
+        return level
+    
+    @classmethod
+    async def from_ids(cls, level_ids: List[int], full: bool = True) -> list:
+        """Creates a list of `Level` instances for all of `level_ids`, using
+        a single MySQL query for all of the levels that are not cached.
+        
+        Args:
+            level_ids (list): The IDs of the levels in the database.
+            full (bool): Whether non-crucial data will be also fetched (such
+                as comments).
+        
+        Returns:
+            List of `Level` objects in the order of `level_ids`. Levels that
+                are not found are left out.
+        """
+
+        # Grab everything we can from the cache first.
+        levels = {}
+        missing = []
+        for level_id in dict.fromkeys(level_ids):
+            if cache_l := glob.level_cache.get(level_id):
+                levels[level_id] = cache_l
+            else:
+                missing.append(level_id)
+
+        # Fetch all of the rest at once.
+        if missing:
+            levels_db = await glob.sql.fetchall(
+                LEVEL_SELECT + "WHERE levels.id IN ("
+                + ",".join(["%s"] * len(missing)) + ")",
+                missing
+            )
+
+            # Levels often share songs. The ones missing from the db are
+            # resolved once here, else every level would fetch (and insert)
+            # the same song at once.
+            missing_songs = list({
+                level_db[SONG_ID_INDEX] for level_db in levels_db
+                if level_db[SONG_ID_INDEX]
+                and level_db[SONG_ROW_SLICE.start] is None
+            })
+            songs = dict.fromkeys(missing_songs)
+            if missing_songs:
+                # The JOIN already showed they are not in the db.
+                for song in await Song.from_ids(missing_songs, sql= False):
+                    songs[song.id] = song
+
+            new_levels = [cls() for _ in levels_db]
+            await asyncio.gather(*[
+                level._set_row(level_db, songs)
+                for level, level_db in zip(new_levels, levels_db)
+            ])
+
+            for level in new_levels:
+                if full:
+                    await level._fetch_comments()
+
+                level.cache()
+                levels[level.id] = level
+
+        return [levels[l_id] for l_id in level_ids if l_id in levels]
     
     @classmethod
     async def from_submit(
@@ -379,3 +568,55 @@ class Level:
         """
 
         return self.rate_status & status > 0
+    
+    def has_any(self, statuses: int) -> bool:
+        """Checks if the level has any of the rating statuses in the
+        `statuses` mask, using a single bitwise and.
+        
+        Args:
+            statuses (int): The level statuses (ORed together) to check for.
+
+        Example:
+        ```py
+        # Checking if the level is either epic or magic.
+        l.has_any(LevelStatus.EPIC | LevelStatus.MAGIC)
+        ```
+
+        Returns:
+            `bool` corresponding to whether the level has any of the statuses.
+        """
+
+        return bool(self.rate_status & statuses)
+    
+    def has_all(self, statuses: int) -> bool:
+        """Checks if the level has all of the rating statuses in the
+        `statuses` mask, using a single bitwise and.
+        
+        Args:
+            statuses (int): The level statuses (ORed together) to check for.
+
+        Returns:
+            `bool` corresponding to whether the level has all of the statuses.
+        """
+
+        return self.rate_status & statuses == statuses
+
+def _build_row_applier():
+    """Generates the `Level._apply_row` function, which sets all of the
+    attributes from `LEVEL_ROW_FIELDS` using a level row.
+    
+    Note:
+        The function is generated so its just a straight list of attribute
+            sets, with no loops or `setattr` calls.
+    """
+
+    src = "def _apply_row(self, row):\n" + "\n".join(
+        f"    self.{attr} = row[{idx}]"
+        for idx, (_, attr) in enumerate(LEVEL_ROW_FIELDS)
+        if attr is not None
+    )
+    ns = {}
+    exec(src, ns)
+    return ns["_apply_row"]
+
+Level._apply_row = _build_row_applier()
@@ -5,10 +5,23 @@ from web.client import post_request
 from helpers.common import is_numeric
 from utils.gdform import parse_to_dict, gd_dict_str
 from logger import error, debug
+from typing import List
+import asyncio
+
+# Local Consts.
+# The `songs` table columns expected in a row by `Song._from_row`, in order.
+SONG_ROW_COLUMNS = (
+    "id", "title", "author_id", "author_name", "size", "author_yt", "download"
+)
 
 class Song:
     """The object representation of the GDPyS and Geometry Dash songs."""
 
+    __slots__ = (
+        "id", "title", "author_id", "author_name", "size", "author_yt", "url",
+        "_resp_cache"
+    )
+
     def __init__(self):
         """Sets the placeholder variables. Please
         use the classmethods instead."""
@@ -20,6 +33,9 @@ class Song:
         self.size: float = 0.0 # 2dp float.
         self.author_yt: str = ""
         self.url: str = ""
+
+        # The built `resp` as songs pretty much never change.
+        self._resp_cache: str = None
     
     @property
     def full_name(self) -> str:
@@ -40,7 +56,6 @@ class Song:
             None if not found.
         """
 
-        self = cls()
         # Simple MySQL query.
         song_db = await glob.sql.fetchone(
             "SELECT id, title, author_id, author_name,"
@@ -52,6 +67,27 @@ class Song:
         if song_db is None:
             return
         
+        return cls._from_row(song_db)
+    
+    @classmethod
+    def _from_row(cls, song_row: tuple):
+        """Creates an instance of `Song` from an already fetched row of the
+        `songs` table, with the columns ordered as in `SONG_ROW_COLUMNS`.
+
+        Args:
+            song_row (tuple): The row of song data.
+        
+        Returns:
+            Instance of `Song` if the row is set.
+            None if the row is empty (the song was not found by a JOIN).
+        """
+
+        # LEFT JOINs will give us a row of NULLs.
+        if song_row[0] is None:
+            return
+
+        self = cls()
+
         # Set data.
         (
             self.id,
@@ -61,7 +97,7 @@ class Song:
             self.size,
             self.author_yt,
             self.url
-        ) = song_db
+        ) = song_row
 
         return self
 
@@ -129,7 +165,7 @@ class Song:
             None if not found.
         """
 
-        if not song_id: return Song() # Empty because else causes errors lol.
+        if not song_id: return _EMPTY_SONG # Empty because else causes errors lol.
 
         # First we check if its already cached.
         if s := glob.song_cache.get(song_id):
@@ -152,6 +188,67 @@ class Song:
         # Song doesn't exist to our knowledge.
         return
     
+    @classmethod
+    async def from_ids(cls, song_ids: List[int], sql: bool = True) -> list:
+        """Fetches the song objects for all of `song_ids`, fetching every
+        song that is not cached using a single MySQL query.
+
+        Note:
+            Songs that are not found in the database are all fetched from
+                Boomlings at once, then inserted into the database and
+                cached.
+
+        Args:
+            song_ids (list): The Newgrounds IDs of the songs to fetch.
+            sql (bool): Whether the database should be searched. Set this to
+                `False` if the songs are already known to not be in it.
+        
+        Returns:
+            List of `Song` objects in the order of `song_ids`. Songs that are
+                not found are left out.
+        """
+
+        # Grab everything we can from the cache first.
+        songs = {}
+        missing = []
+        for song_id in dict.fromkeys(song_ids):
+            if not song_id:
+                songs[song_id] = _EMPTY_SONG
+            elif s := glob.song_cache.get(song_id):
+                songs[song_id] = s
+            else:
+                missing.append(song_id)
+        
+        if missing and sql:
+            songs_db = await glob.sql.fetchall(
+                "SELECT id, title, author_id, author_name, size, author_yt, "
+                "download FROM songs WHERE id IN ("
+                + ",".join(["%s"] * len(missing)) + ")",
+                missing
+            )
+
+            for song_db in songs_db:
+                s = cls._from_row(song_db)
+                glob.song_cache.cache(s.id, s)
+                songs[s.id] = s
+            
+        # The ones not in the db have to be fetched from boomlings. We
+        # already know they are not cached or in the db, so go straight
+        # there, fetching them all at once.
+        if not_found := [s_id for s_id in missing if s_id not in songs]:
+            boomlings_songs = await asyncio.gather(*[
+                cls.from_boomlings(s_id) for s_id in not_found
+            ])
+
+            for song_id, s in zip(not_found, boomlings_songs):
+                if s is None:
+                    continue
+                await s.insert()
+                glob.song_cache.cache(s.id, s)
+                songs[song_id] = s
+
+        return [songs[s_id] for s_id in song_ids if s_id in songs]
+    
     async def insert(self):
         """Inserts the song data from the object into the MySQL database."""
 
@@ -177,6 +274,9 @@ class Song:
                 self.url
             )
         )
+
+        # The ID may have changed.
+        self._resp_cache = None
     
     def __str__(self) -> str:
         """Returns a string representation of the song."""
@@ -187,6 +287,13 @@ class Song:
     def resp(self) -> str:
         """"A Geometry Dash HTTP response styled song object."""
 
+        if self._resp_cache is None:
+            self._resp_cache = self._build_resp()
+        return self._resp_cache
+    
+    def _build_resp(self) -> str:
+        """Builds the Geometry Dash HTTP response styled song object."""
+
         return gd_dict_str(
             {
                 1: self.id,
@@ -199,3 +306,7 @@ class Song:
             },
             "~|~"
         )
+
+# Shared placeholder for levels without a custom song. As it is shared, it
+# should NEVER be modified.
+_EMPTY_SONG = Song()
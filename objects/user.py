@@ -12,6 +12,16 @@ from typing import List
 from utils.gdform import gd_dict_str
 import re
 
+# Local Consts.
+# The `users` table columns expected in a row by `User._from_row`, in order.
+USER_ROW_COLUMNS = (
+    "id", "username", "privileges", "email", "password", "timestamp",
+    "yt_url", "twitter_url", "twitch_url", "req_status", "stars", "diamonds",
+    "coins", "ucoins", "demons", "cp", "colour1", "colour2", "icon", "ship",
+    "ufo", "wave", "ball", "robot", "spider", "explosion", "glow",
+    "display_icon"
+)
+
 @dataclass
 class Stats:
     """An object representation of a user's stats, Providing storage and
@@ -357,6 +367,52 @@ class User:
             await cls.accomment_db()
         return cls
     
+    @classmethod
+    async def _from_row(cls, user_row: tuple):
+        """Creates an instance of `User` from an already fetched row of the
+        `users` table, with the columns ordered as in `USER_ROW_COLUMNS`.
+
+        Note:
+            This is meant for queries that JOIN the users table, so no extra
+                queries for the user are made (apart from a privilege cache
+                miss). Only the minimal profile is set, so the rank is not
+                calculated and comments are not fetched.
+        
+        Args:
+            user_row (tuple): The row of user data.
+        
+        Returns:
+            None if the row is empty (the user was not found by the JOIN).
+            User object otherwise.
+        """
+
+        # LEFT JOINs will give us a row of NULLs.
+        if user_row[0] is None:
+            return
+
+        cls = cls()
+
+        priv = 0
+        (cls.id, cls.name, priv,
+        cls.email, cls.bcrypt_pass,
+        cls.registered_timestamp,
+        cls.youtube_url, cls.twitter_url,
+        cls.twitch_url, req_status,
+        cls.stats.stars, cls.stats.diamonds,
+        cls.stats.coins, cls.stats.u_coins,
+        cls.stats.demons, cls.stats.cp,
+        cls.stats.colour1, cls.stats.colour2,
+        cls.stats.icon, cls.stats.ship,
+        cls.stats.ufo, cls.stats.wave, cls.stats.ball,
+        cls.stats.robot, cls.stats.spider,
+        cls.stats.explosion, cls.stats.glow,
+        cls.stats.display_icon) = user_row
+
+        cls.stats.user_id = cls.id
+        cls.req_states = ReqStats(req_status)
+        cls.privilege = await Privilege.from_priv_enum(priv)
+        return cls
+    
     @classmethod
     async def from_name(cls, name: str):
         """Attempts to fetch the user object from their name.
@@ -0,0 +1,26 @@
+# Optional build script for compiling the hot GDPyS objects with Cython.
+# GDPyS runs perfectly fine without this, it is purely a speedup.
+#
+# Usage: GDPYS_SPEEDUPS=1 python setup.py build_ext --inplace
+from setuptools import setup
+import os
+
+# Modules that are compiled. They stay regular importable python files, so
+# development does not require building anything.
+SPEEDUP_MODULES = [
+    "objects/level.py",
+    "objects/song.py"
+]
+
+ext_modules = []
+if os.environ.get("GDPYS_SPEEDUPS"):
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        SPEEDUP_MODULES,
+        compiler_directives= {"language_level": 3}
+    )
+
+setup(
+    name= "GDPyS",
+    ext_modules= ext_modules
+)
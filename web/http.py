@@ -3,7 +3,6 @@ from dataclasses import dataclass
 from typing import Callable, Union
 from .sql import MySQLPool
 from helpers.auth import Auth
-from helpers.common import dict_keys
 from const import HandlerTypes, HTTP_CODES, GDPyS
 from logger import error, info, debug
 from helpers.time import Timer
@@ -247,13 +246,13 @@ class Handler:
         # These are just bitwise operators so we can to this.
         return self.status & status > 0
     
-    def verify_postargs(self, args: Union[list, tuple]) -> bool:
+    def verify_postargs(self, args: Union[list, tuple, dict]) -> bool:
         """Check if the provided post `args` contain the
         required information for the handler.
         
         Args:
-            args (list, tuple): A list or tuple of the
-                post args provided.
+            args (list, tuple, dict): A list, tuple or dict of
+                the post args provided.
         
         Returns:
             A bool of whether all required post args are
@@ -417,7 +416,7 @@ class GDPySWeb:
                 args.append(self.pool)
             
             # Check if they have the required args.
-            if not handler.verify_postargs(dict_keys(request.post)):
+            if not handler.verify_postargs(request.post):
                 # Idk just use the error handler.
                 raise KeyError
             
@@ -478,20 +477,21 @@ class GDPySWeb:
             code = 500
             resp_str = await handler.handler(request, tb)
         
-        # Just ensure it is str.
+        # Just ensure it is bytes. Bytes (eg level data) are sent as they are
+        # so they dont have to be encoded.
         if handler.has_status(HandlerTypes.JSON):
-            if "status" not in dict_keys(resp_str): resp_str["status"] = 200
-            resp_str = json.dumps(resp_str)
+            if "status" not in resp_str: resp_str["status"] = 200
+            resp_str = json.dumps(resp_str).encode()
             # Important content type header
             request.add_header("Content-Type: application/json")
-        else:
-            resp_str = str(resp_str)
+        elif not isinstance(resp_str, bytes):
+            resp_str = str(resp_str).encode()
 
         # Debug log the resp.
         debug(resp_str)
 
         # Return it
-        return code, resp_str.encode()
+        return code, resp_str
     
     def add_handler(
         self,
@@ -513,7 +513,7 @@ class GDPySWeb:
                 contains information such as response type (eg JSON or simple
                 plain text, GD authed and DB).
             handler (Callable): The coroutine function for the handler. Must
-                return str for plaintext handlers and dict/list for JSON
+                return str or bytes for plaintext handlers and dict/list for JSON
                 ones.
             req_postargs (tuple, list): A list of all of the post arguments
                 required for the request.